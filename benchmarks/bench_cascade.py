@@ -0,0 +1,95 @@
+"""The OS → device → manufacturer → model → mainboard dropdown cascade."""
+import json
+import os
+import tempfile
+
+from common import ROOT, FakePage, load_antic, best_of, best_of_fresh, find_controls
+
+antic = load_antic()
+LEVELS = ("os", "device_type", "manufacturer", "model", "mainboard")
+
+
+def walk_catalog(catalog) -> int:
+    """Visit every selection of the cascade as the dropdown handlers do; returns the lookups made."""
+    lookups = 0
+
+    def visit(selection: dict, depth: int) -> None:
+        nonlocal lookups
+        level = LEVELS[depth]
+        options = catalog.options(level, selection)
+        lookups += 1
+        if level == "model":
+            for field in catalog.PERIPHERAL_FIELDS:
+                catalog.options(field, selection)
+                lookups += 1
+        if depth + 1 == len(LEVELS):
+            for field in catalog.SPEC_FIELDS:
+                for option in options:
+                    catalog.options(field, {**selection, "mainboard": option.key})
+                    lookups += 1
+            return
+        values = [option.key for option in options]
+        if level == "model":
+            values.append("")
+        for value in values:
+            visit({**selection, level: value}, depth + 1)
+
+    visit({}, 0)
+    return lookups
+
+
+def config_page_cascade() -> dict:
+    """Open the new-profile page of ``main`` and drive every dropdown change handler."""
+    page = FakePage()
+    antic.main(page)
+    open_config_page = page.appbar.actions[0].on_click
+    open_ms = best_of(lambda: open_config_page(None), repeat=3)
+    dropdowns = {c.label: c for c in find_controls(page.controls, lambda c: isinstance(c, antic.ft.Dropdown))}
+    chain = [dropdowns[label] for label in ("OS", "Loại thiết bị", "Hãng", "Model", "Mainboard")]
+
+    def drive(depth: int = 0) -> None:
+        if depth == len(chain):
+            return
+        for option in list(chain[depth].options):
+            chain[depth].value = option.key
+            chain[depth].on_change(None)
+            drive(depth + 1)
+
+    return {"ui_open_config_page_ms": open_ms, "ui_cascade_walk_ms": best_of(drive, repeat=3)}
+
+
+def run() -> dict:
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            os.mkdir("config")
+            os.mkdir("cookies")
+            os.mkdir("hardware")
+            for path in (antic.HARDWARE_DATA_PATH, antic.LAPTOP_MODELS_PATH, antic.DEVICE_DATA_PATH):
+                with open(ROOT / path, "rb") as src, open(path, "wb") as dst:
+                    dst.write(src.read())
+
+            def drop_cache():
+                if os.path.exists(antic.HARDWARE_CATALOG_CACHE_PATH):
+                    os.remove(antic.HARDWARE_CATALOG_CACHE_PATH)
+
+            results["catalog_build_ms"] = best_of_fresh(drop_cache, lambda _: antic.HardwareCatalog.load(), repeat=3)
+            results["catalog_cached_load_ms"] = best_of(antic.HardwareCatalog.load)
+            catalog = antic.HardwareCatalog.load()
+            results["cascade_lookups"] = walk_catalog(catalog)
+            results["cascade_walk_ms"] = best_of(lambda: walk_catalog(catalog))
+
+            try:
+                results.update(config_page_cascade())
+            except (TypeError, AttributeError) as e:
+                # The UI targets the flet API of its time; newer releases renamed control arguments.
+                results["ui_skipped"] = f"{type(e).__name__}: {e}"
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,92 @@
+"""Cookie jars: legacy indented JSON vs CookieStore, and Netscape parsing."""
+import itertools
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from common import load_antic, best_of, best_of_fresh
+
+antic = load_antic()
+
+
+def synthetic_jar(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [{
+        "name": f"cookie_{n}",
+        "value": "%032x" % rng.getrandbits(128),
+        "domain": f".site{n % 200}.example",
+        "path": "/",
+        "expires": time.time() + rng.randint(3600, 86400 * 365),
+        "httpOnly": rng.random() < 0.5,
+        "secure": True,
+    } for n in range(count)]
+
+
+def netscape_jar(cookies: list) -> str:
+    return "# Netscape HTTP Cookie File\n" + "".join(
+        f"{'#HttpOnly_' if c['httpOnly'] else ''}{c['domain']}\tTRUE\t{c['path']}\t{'TRUE' if c['secure'] else 'FALSE'}\t{int(c['expires'])}\t{c['name']}\t{c['value']}\n"
+        for c in cookies
+    )
+
+
+def run(count: int = 5000, changed: float = 0.01, netscape_count: int = 100000) -> dict:
+    cookies = synthetic_jar(count)
+    updated = [dict(c) for c in cookies]
+    for cookie in random.Random(1).sample(updated, int(count * changed)):
+        cookie["value"] = "updated"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.json")
+        base_path = os.path.join(tmp, "base.json")
+        antic.CookieStore(base_path).save(cookies)
+        runs = itertools.count()
+
+        def write_legacy():
+            with open(legacy_path, "w", encoding="utf-8") as f:
+                json.dump(obj=cookies, fp=f, indent=4)
+
+        def empty_store():
+            return antic.CookieStore(os.path.join(tmp, f"store{next(runs)}.json"))
+
+        def saved_store():
+            store = empty_store()
+            shutil.copyfile(base_path, store.path)
+            store.load()
+            return store
+
+        legacy_ms = best_of(write_legacy)
+        legacy_bytes = os.path.getsize(legacy_path)
+
+        full_ms = best_of_fresh(empty_store, lambda store: store.save(cookies))
+        full_bytes = os.path.getsize(base_path)
+        unchanged_ms = best_of_fresh(saved_store, lambda store: store.save(cookies))
+        incremental_ms = best_of_fresh(saved_store, lambda store: store.save(updated))
+        store = saved_store()
+        store.save(updated)
+        appended_bytes = os.path.getsize(store.path) - full_bytes
+
+        load_ms = best_of(lambda: antic.CookieStore(base_path).load())
+
+    jar = netscape_jar(synthetic_jar(netscape_count, seed=2))
+    netscape_ms = best_of(lambda: antic.parse_netscape_cookies(jar), repeat=3)
+
+    return {
+        "cookies": count,
+        "legacy_write_ms": legacy_ms,
+        "legacy_bytes": legacy_bytes,
+        "store_full_write_ms": full_ms,
+        "store_bytes": full_bytes,
+        "store_unchanged_save_ms": unchanged_ms,
+        "store_incremental_save_ms": incremental_ms,
+        "store_incremental_bytes": appended_bytes,
+        "store_load_ms": load_ms,
+        "netscape_cookies": netscape_count,
+        "netscape_parse_ms": netscape_ms,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,49 @@
+"""GeoIP lookups through get_proxy_info against generated test databases."""
+import json
+import os
+import tempfile
+
+from common import load_antic, best_of, best_of_fresh
+from mmdb_writer import write_test_databases
+
+antic = load_antic()
+
+
+def run(networks: int = 4096, lookups: int = 4096) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        country_path = os.path.join(tmp, "country.mmdb")
+        city_path = os.path.join(tmp, "city.mmdb")
+        ips = write_test_databases(country_path, city_path, networks)[:lookups]
+
+        antic.get_timezone_resolver().resolve(0.0, 0.0)
+        finder = antic.get_timezone_resolver()._finder
+
+        def cold_service():
+            # A new service and an empty timezone cell cache, sharing the loaded polygon data.
+            resolver = antic._timezone_resolver = antic.TimezoneResolver()
+            resolver._finder = finder
+            antic._geoip_service = antic.GeoIPService(country_path, city_path, cache_size=lookups)
+            return antic._geoip_service
+
+        try:
+            cold_ms = best_of_fresh(cold_service, lambda service: [antic.get_proxy_info(ip) for ip in ips], repeat=3)
+            warm_ms = best_of(lambda: [antic.get_proxy_info(ip) for ip in ips])
+            batch_ms = best_of_fresh(cold_service, lambda service: service.lookup_many(ips), repeat=3)
+            sample = antic.get_proxy_info(ips[0])
+        finally:
+            antic._geoip_service.close()
+            antic._geoip_service = None
+            antic._timezone_resolver = None
+
+    return {
+        "networks": networks,
+        "lookups": lookups,
+        "cold_lookup_ms": cold_ms,
+        "warm_lookup_ms": warm_ms,
+        "lookup_many_ms": batch_ms,
+        "sample_timezone": sample["timezone"],
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=4))
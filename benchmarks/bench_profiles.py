@@ -0,0 +1,79 @@
+"""Profile catalog and the profile list page on thousands of generated profiles."""
+import itertools
+import json
+import os
+import tempfile
+import types
+
+from common import ROOT, FakePage, load_antic, best_of, best_of_fresh, find_controls
+
+antic = load_antic()
+
+
+def repo_hardware_catalog():
+    """Return a HardwareCatalog over the data files shipped in the repository."""
+    paths = (antic.HARDWARE_DATA_PATH, antic.LAPTOP_MODELS_PATH, antic.DEVICE_DATA_PATH)
+    data = []
+    for path in paths:
+        with open(ROOT / path, "r", encoding="utf-8") as f:
+            data.append(json.load(f))
+    return antic.HardwareCatalog.from_data(*data)
+
+
+def profile_list_page() -> dict:
+    """Build the UI of ``main``, whose first page is ``get_config_content``, then re-render it through search."""
+    pages = []
+    build_ms = best_of_fresh(lambda: pages.append(FakePage()) or pages[-1], antic.main, repeat=3)
+    page = pages[-1]
+    search_field = find_controls(page.controls, lambda c: getattr(c, "hint_text", None) == "Tìm kiếm")[0]
+    event = types.SimpleNamespace(control=search_field)
+    render_ms = best_of(lambda: search_field.on_submit(event))
+    search_field.value = "Profile 1"
+    search_ms = best_of(lambda: search_field.on_submit(event))
+    return {"ui_main_ms": build_ms, "ui_config_content_ms": render_ms, "ui_search_ms": search_ms}
+
+
+def run(count: int = 5000, seed: int = 1) -> dict:
+    generator = antic.ProfileGenerator(repo_hardware_catalog())
+    results = {"profiles": count}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            runs = itertools.count()
+            configs = generator.generate(count, seed)
+            results["generate_ms"] = best_of(lambda: generator.generate(count, seed), repeat=3)
+
+            def empty_catalog():
+                directory = f"config{next(runs)}"
+                os.mkdir(directory)
+                return antic.ProfileCatalog(directory, f"{directory}.index.json")
+
+            results["create_many_ms"] = best_of_fresh(empty_catalog, lambda catalog: catalog.create_many(configs), repeat=3)
+
+            os.mkdir("config")
+            os.mkdir("cookies")
+            antic.ProfileCatalog().create_many(configs)
+
+            def unindexed_catalog():
+                if os.path.exists(antic.PROFILE_INDEX_PATH):
+                    os.remove(antic.PROFILE_INDEX_PATH)
+                return antic.ProfileCatalog()
+
+            results["catalog_cold_scan_ms"] = best_of_fresh(unindexed_catalog, lambda catalog: catalog.refresh(), repeat=3)
+            results["catalog_open_ms"] = best_of(lambda: antic.ProfileCatalog().profiles())
+            catalog = antic.ProfileCatalog()
+            results["catalog_search_ms"] = best_of(lambda: catalog.search("moscow", lang="ru-RU"))
+
+            try:
+                results.update(profile_list_page())
+            except (TypeError, AttributeError) as e:
+                # The UI targets the flet API of its time; newer releases renamed control arguments.
+                results["ui_skipped"] = f"{type(e).__name__}: {e}"
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,70 @@
+"""Helpers shared by the benchmark modules."""
+import importlib.util
+import pathlib
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+_antic = None
+
+
+def load_antic():
+    """Import ``antic.py`` once per process, with networking kept offline."""
+    global _antic
+    if _antic is None:
+        spec = importlib.util.spec_from_file_location("antic", ROOT / "antic.py")
+        _antic = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_antic)
+        _antic._user_agent = {"user_agent": _antic.DEFAULT_USER_AGENT, "fetched_at": time.time()}
+    return _antic
+
+
+def timed(func) -> float:
+    """Run ``func`` once and return its duration in milliseconds."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """Return the fastest of ``repeat`` runs of ``func`` in milliseconds, rounded."""
+    return round(min(timed(func) for _ in range(repeat)), 3)
+
+
+def best_of_fresh(setup, func, repeat: int = 5) -> float:
+    """Like :func:`best_of` for a ``func`` that changes state: each run gets a new ``setup()`` result, untimed."""
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        times.append(timed(lambda: func(state)))
+    return round(min(times), 3)
+
+
+class FakePage:
+    """Just enough of ``ft.Page`` to build the UI of :func:`antic.main` headlessly."""
+
+    def __init__(self):
+        self.controls = []
+
+    def add(self, *controls):
+        self.controls.extend(controls)
+
+    def update(self):
+        pass
+
+
+def find_controls(control, predicate) -> list:
+    """Return every control below ``control`` (a control or a list) matching ``predicate``."""
+    found = []
+    stack = list(control) if isinstance(control, list) else [control]
+    while stack:
+        current = stack.pop()
+        if predicate(current):
+            found.append(current)
+        for name in ("controls", "actions"):
+            children = getattr(current, name, None)
+            if isinstance(children, list):
+                stack.extend(children)
+        child = getattr(current, "content", None)
+        if child is not None and not isinstance(child, str):
+            stack.append(child)
+    return found
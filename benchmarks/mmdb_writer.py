@@ -0,0 +1,146 @@
+"""Minimal MaxMind DB writer for generating offline GeoIP test databases.
+
+Only what the benchmarks and tests need: an IPv4 search tree with 24-bit
+records over non-overlapping networks, and maps, arrays, strings,
+doubles, booleans and unsigned integers in the data section.
+"""
+import ipaddress
+import json
+import struct
+import time
+from typing import NamedTuple
+
+UINT16, UINT32, UINT64 = 5, 6, 9
+METADATA_MARKER = b"\xab\xcd\xefMaxMind.com"
+
+
+class Typed(NamedTuple):
+    """An unsigned integer that must be stored with a specific type number."""
+    type_num: int
+    value: int
+
+
+def _control(type_num: int, size: int) -> bytes:
+    first, extended = (0, bytes([type_num - 7])) if type_num > 7 else (type_num, b"")
+    if size < 29:
+        return bytes([first << 5 | size]) + extended
+    if size < 285:
+        return bytes([first << 5 | 29]) + extended + bytes([size - 29])
+    if size < 65821:
+        return bytes([first << 5 | 30]) + extended + (size - 285).to_bytes(2, "big")
+    return bytes([first << 5 | 31]) + extended + (size - 65821).to_bytes(3, "big")
+
+
+def encode(value) -> bytes:
+    if isinstance(value, Typed):
+        payload = value.value.to_bytes((value.value.bit_length() + 7) // 8, "big")
+        return _control(value.type_num, len(payload)) + payload
+    if isinstance(value, bool):
+        return _control(14, int(value))
+    if isinstance(value, int):
+        return encode(Typed(UINT32 if value < 2 ** 32 else UINT64, value))
+    if isinstance(value, float):
+        return _control(3, 8) + struct.pack(">d", value)
+    if isinstance(value, str):
+        payload = value.encode("utf-8")
+        return _control(2, len(payload)) + payload
+    if isinstance(value, dict):
+        return _control(7, len(value)) + b"".join(encode(str(k)) + encode(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return _control(11, len(value)) + b"".join(encode(v) for v in value)
+    raise TypeError(f"cannot encode {type(value).__name__}")
+
+
+def write_mmdb(path: str, database_type: str, networks, build_epoch: int | None = None) -> int:
+    """Write ``(network, record)`` pairs to ``path``; returns the node count."""
+    data = bytearray()
+    offsets = {}
+    nodes = [[None, None]]
+    for network, record in networks:
+        network = ipaddress.IPv4Network(network)
+        key = json.dumps(record, sort_keys=True)
+        if key not in offsets:
+            offsets[key] = len(data)
+            data += encode(record)
+
+        address = int(network.network_address)
+        node = 0
+        for depth in range(network.prefixlen):
+            bit = address >> (31 - depth) & 1
+            if depth == network.prefixlen - 1:
+                nodes[node][bit] = ("data", offsets[key])
+            else:
+                child = nodes[node][bit]
+                if child is None or child[0] == "data":
+                    nodes.append([None, None])
+                    child = nodes[node][bit] = ("node", len(nodes) - 1)
+                node = child[1]
+
+    node_count = len(nodes)
+
+    def pointer(record) -> bytes:
+        if record is None:
+            value = node_count
+        elif record[0] == "node":
+            value = record[1]
+        else:
+            value = node_count + 16 + record[1]
+        return value.to_bytes(3, "big")
+
+    metadata = {
+        "binary_format_major_version": Typed(UINT16, 2),
+        "binary_format_minor_version": Typed(UINT16, 0),
+        "build_epoch": Typed(UINT64, int(time.time()) if build_epoch is None else build_epoch),
+        "database_type": database_type,
+        "description": {"en": f"Synthetic {database_type} test database"},
+        "ip_version": Typed(UINT16, 4),
+        "languages": ["en"],
+        "node_count": Typed(UINT32, node_count),
+        "record_size": Typed(UINT16, 24),
+    }
+    with open(path, "wb") as f:
+        f.write(b"".join(pointer(left) + pointer(right) for left, right in nodes))
+        f.write(bytes(16))
+        f.write(data)
+        f.write(METADATA_MARKER)
+        f.write(encode(metadata))
+    return node_count
+
+
+CITIES = (
+    ("US", "New York", 40.71, -74.01),
+    ("US", "Chicago", 41.88, -87.63),
+    ("US", "Los Angeles", 34.05, -118.24),
+    ("GB", "London", 51.51, -0.13),
+    ("FR", "Paris", 48.86, 2.35),
+    ("DE", "Berlin", 52.52, 13.40),
+    ("RU", "Moscow", 55.76, 37.62),
+    ("PL", "Warsaw", 52.23, 21.01),
+    ("NL", "Amsterdam", 52.37, 4.90),
+    ("ES", "Madrid", 40.42, -3.70),
+    ("PT", "Lisbon", 38.72, -9.14),
+    ("CN", "Shanghai", 31.23, 121.47),
+    ("JP", "Tokyo", 35.68, 139.69),
+    ("BR", "Sao Paulo", -23.55, -46.63),
+    ("AU", "Sydney", -33.87, 151.21),
+)
+
+
+def write_test_databases(country_path: str, city_path: str, count: int = 4096, first: str = "11.0.0.0") -> list:
+    """Write matching Country and City databases for ``count`` consecutive /24 networks.
+
+    Network ``n`` is placed in ``CITIES[n % len(CITIES)]``. Returns one
+    address inside every network, in order.
+    """
+    base = int(ipaddress.IPv4Address(first))
+    networks = [ipaddress.IPv4Network((base + (n << 8), 24)) for n in range(count)]
+    places = [CITIES[n % len(CITIES)] for n in range(count)]
+
+    write_mmdb(country_path, "GeoLite2-Country", (
+        (network, {"country": {"iso_code": code, "names": {"en": code}}}) for network, (code, _, _, _) in zip(networks, places)
+    ))
+    write_mmdb(city_path, "GeoLite2-City", (
+        (network, {"city": {"names": {"en": city}}, "country": {"iso_code": code, "names": {"en": code}}, "location": {"latitude": lat, "longitude": lng}})
+        for network, (code, city, lat, lng) in zip(networks, places)
+    ))
+    return [str(network.network_address + 1) for network in networks]
@@ -0,0 +1,96 @@
+"""Run the benchmarks and compare them with the recorded baseline.
+
+    python benchmarks/run.py                  # compare with benchmarks/baseline.json
+    python benchmarks/run.py geoip cookies    # only some benchmarks
+    python benchmarks/run.py --record         # store this run as the new baseline
+
+Every ``bench_<name>.py`` next to this file exposes ``run() -> dict``.
+Metrics ending in ``_ms`` regress when they grow, those ending in
+``_per_s`` when they shrink, by more than ``--tolerance``; other values
+are informational. Everything runs offline on generated data with fixed
+seeds, and timings are the best of several runs.
+
+The ``ui_*`` metrics build the real flet UI on a fake page and need the
+flet release the UI is written against (0.28); with a newer flet those
+benchmarks report ``ui_skipped`` and every baseline metric they could not
+measure is listed as NOT COVERED.
+"""
+import argparse
+import importlib
+import importlib.metadata
+import json
+import pathlib
+import platform
+import sys
+
+HERE = pathlib.Path(__file__).resolve().parent
+BASELINE_PATH = HERE / "baseline.json"
+MIN_DELTA_MS = 1.0
+
+
+def available() -> list:
+    return sorted(path.stem[len("bench_"):] for path in HERE.glob("bench_*.py"))
+
+
+def regressions(name: str, current: dict, baseline: dict, tolerance: float) -> list:
+    found = []
+    for metric, value in current.items():
+        before = baseline.get(metric)
+        if not isinstance(value, (int, float)) or not isinstance(before, (int, float)) or not before:
+            continue
+        if metric.endswith("_ms") and value > before * (1 + tolerance) and value - before > MIN_DELTA_MS:
+            found.append(f"{name}.{metric}: {before} -> {value} ms")
+        elif metric.endswith("_per_s") and value < before / (1 + tolerance):
+            found.append(f"{name}.{metric}: {before} -> {value} per s")
+    return found
+
+
+def uncovered(name: str, current: dict, baseline: dict) -> list:
+    return [f"{name}.{metric}" for metric in baseline if metric.endswith(("_ms", "_per_s")) and metric not in current]
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Run the antic.py benchmarks.")
+    parser.add_argument("benchmarks", nargs="*", help=f"benchmarks to run (default: all of {', '.join(available())})")
+    parser.add_argument("--record", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown as a fraction of the baseline")
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(available())
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    sys.path.insert(0, str(HERE))
+    try:
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {"results": {}}
+
+    results = {}
+    found = []
+    missing = []
+    for name in args.benchmarks or available():
+        results[name] = importlib.import_module(f"bench_{name}").run()
+        print(json.dumps({"benchmark": name, **results[name]}, ensure_ascii=False), flush=True)
+        found += regressions(name, results[name], baseline["results"].get(name, {}), args.tolerance)
+        missing += uncovered(name, results[name], baseline["results"].get(name, {}))
+        if "ui_skipped" in results[name]:
+            print(f"NOT COVERED {name} UI: {results[name]['ui_skipped']}", file=sys.stderr)
+
+    if args.record:
+        baseline["results"].update(results)
+        baseline["environment"] = {"python": platform.python_version(), "flet": importlib.metadata.version("flet"), "platform": platform.platform(), "machine": platform.machine()}
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=4, ensure_ascii=False)
+            f.write("\n")
+        return 0
+
+    for metric in missing:
+        print(f"NOT COVERED {metric} (in the baseline but not measured)", file=sys.stderr)
+    for line in found:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,35 @@
+import asyncio
+import importlib.util
+import io
+import json
+import pathlib
+import time
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_run_batch_reports_json_lines(monkeypatch):
+    started = []
+
+    async def fake_run_profile(profile, launcher, timings, usage, **options):
+        started.append(time.monotonic())
+        assert options == {"headless": True, "url": "about:blank", "wait_close": False}
+        if profile == "broken.json":
+            raise FileNotFoundError(profile)
+        for phase in ("driver", "launch", "context", "navigation"):
+            timings[phase] = 0.001
+        usage.update(warm=True, bytes_saved=1024)
+
+    monkeypatch.setattr(antic, "run_profile", fake_run_profile)
+    out = io.StringIO()
+    profiles = ["Profile 1.json", "Profile 2.json", "broken.json"]
+    asyncio.run(antic.run_batch(profiles, concurrency=2, rate=50, out=out))
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert sorted(r["profile"] for r in records) == sorted(profiles)
+    ok = [r for r in records if r["ok"]]
+    assert len(ok) == 2
+    assert all(r["navigation"] == 1.0 and r["bytes_saved"] == 1024 for r in ok)
+    assert max(started) - min(started) >= 2 / 50 * 0.9
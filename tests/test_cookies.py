@@ -0,0 +1,153 @@
+import asyncio
+import importlib.util
+import json
+import pathlib
+import time
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def make_cookie(n, expires=-1):
+    return {"name": f"c{n}", "value": str(n), "domain": ".example.com", "path": "/", "expires": expires, "httpOnly": False, "secure": True, "sameSite": "Lax"}
+
+
+def test_cookie_store_appends_only_changes(tmp_path):
+    path = tmp_path / "Profile 1.json"
+    store = antic.CookieStore(str(path))
+    cookies = [make_cookie(n) for n in range(100)]
+    assert store.save(cookies)
+    lines = len(path.read_text(encoding="utf-8").splitlines())
+    assert lines == 100
+
+    assert not store.save(cookies)
+
+    cookies[5] = dict(cookies[5], value="changed")
+    del cookies[7]
+    assert store.save(cookies)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == lines + 2
+
+    loaded = {c["name"]: c for c in antic.CookieStore(str(path)).load()}
+    assert len(loaded) == 99
+    assert loaded["c5"]["value"] == "changed"
+    assert "c7" not in loaded
+    assert "sameSite" not in loaded["c0"]
+
+
+def test_cookie_store_drops_expired_and_converts_legacy(tmp_path):
+    path = tmp_path / "Profile 1.json"
+    legacy = [make_cookie(1), make_cookie(2, expires=time.time() - 10), make_cookie(3, expires=time.time() + 3600)]
+    path.write_text(json.dumps(legacy, indent=4), encoding="utf-8")
+
+    store = antic.CookieStore(str(path))
+    assert [c["name"] for c in store.load()] == ["c1", "c3"]
+    assert store.save(legacy)
+    assert [json.loads(line)["name"] for line in path.read_text(encoding="utf-8").splitlines()] == ["c1", "c3"]
+
+
+def test_cookie_store_compacts_long_log(tmp_path):
+    path = tmp_path / "Profile 1.json"
+    store = antic.CookieStore(str(path))
+    cookie = make_cookie(1)
+    for n in range(100):
+        store.save([dict(cookie, value=str(n))])
+    assert len(path.read_text(encoding="utf-8").splitlines()) <= 2 * 16
+    assert antic.CookieStore(str(path)).load()[0]["value"] == "99"
+
+
+NETSCAPE_JAR = """# Netscape HTTP Cookie File
+
+.example.com\tTRUE\t/\tTRUE\t1999999999\tsid\tabc def
+#HttpOnly_.example.com\tTRUE\t/\tFALSE\t0\tsession\txyz
+broken line
+.example.com\tTRUE\t/\tFALSE\tsoon\tbad\tvalue
+"""
+
+
+def test_iter_cookie_file_netscape(tmp_path):
+    path = tmp_path / "cookies.txt"
+    path.write_text(NETSCAPE_JAR, encoding="utf-8")
+    rejected = []
+    cookies = list(antic.iter_cookie_file(str(path), rejected))
+    assert [c["name"] for c in cookies] == ["sid", "session"]
+    assert cookies[0]["value"] == "abc def"
+    assert cookies[0]["httpOnly"] is False and cookies[0]["secure"] is True
+    assert cookies[1]["httpOnly"] is True and cookies[1]["expires"] == -1
+    assert [number for number, _ in rejected] == [5, 6]
+
+
+def test_iter_cookie_file_json_stream(tmp_path):
+    path = tmp_path / "cookies.json"
+    records = [make_cookie(n) for n in range(20000)] + [{"value": "no name"}]
+    path.write_text("\n  " + json.dumps(records), encoding="utf-8")
+    rejected = []
+    cookies = antic.iter_cookie_file(str(path), rejected)
+    assert next(cookies)["name"] == "c0"
+    assert sum(1 for _ in cookies) == 19999
+    assert rejected == [(20001, "missing name, value or domain")]
+
+
+def test_iter_cookie_file_truncated_json(tmp_path):
+    path = tmp_path / "cookies.json"
+    path.write_text(json.dumps([make_cookie(1), make_cookie(2)])[:-20], encoding="utf-8")
+    rejected = []
+    assert [c["name"] for c in antic.iter_cookie_file(str(path), rejected)] == ["c1"]
+    assert rejected[0][0] == 2
+
+
+class FakePage:
+    async def goto(self, url):
+        self.url = url
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def add_init_script(self, script):
+        pass
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def new_page(self):
+        self.pages.append(FakePage())
+        return self.pages[-1]
+
+    async def cookies(self):
+        return []
+
+    async def close(self):
+        pass
+
+
+class FakeLauncher:
+    async def start(self):
+        pass
+
+    async def browser(self, headless, args):
+        return self
+
+    async def open_context(self, browser, **options):
+        return FakeContext()
+
+
+def test_run_browser_reports_rejected_cookie_lines(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cookies").mkdir()
+    jar = tmp_path / "jar.txt"
+    jar.write_text(".example.com\tTRUE\t/\tTRUE\t1999999999\tsid\tabc\nbroken line\n", encoding="utf-8")
+    metrics = antic.Metrics()
+    monkeypatch.setattr(antic, "metrics", metrics)
+    sink = tmp_path / "metrics.jsonl"
+    metrics.enable(str(sink))
+    usage = {}
+    asyncio.run(antic.run_browser("UA", 1080, 1920, "UTC", "en-US", False, str(jar), True, "Google Inc.", 6, 8, False, "Profile 1.json", launcher=FakeLauncher(), wait_close=False, usage=usage))
+    metrics.disable()
+
+    assert usage["rejected_cookies"] == 1
+    assert capsys.readouterr().out == ""
+    events = [json.loads(line) for line in sink.read_text(encoding="utf-8").splitlines()]
+    event = next(e for e in events if e["name"] == "antic_cookie_import_rejected_total")
+    assert (event["profile"], event["rejected"], event["line"]) == ("Profile 1.json", 1, 2)
@@ -0,0 +1,94 @@
+import asyncio
+import importlib.util
+import json
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def embedded_values(script):
+    line = next(line for line in script.splitlines() if "const fp = " in line)
+    return json.loads(line.split("const fp = ", 1)[1].rstrip(";"))
+
+
+def test_fingerprint_script_escapes_and_caches():
+    vendor = "Google'; alert(1); '\"</script>\u2028"
+    script = antic.fingerprint_script(vendor, 8, 16, hardware={"hw_gpu": "RTX 3060", "hw_sound": "", "battery": "76Wh", "mouse": "Touchpad"})
+    values = embedded_values(script)
+    assert values == {"vendor": vendor, "hardwareConcurrency": 8, "deviceMemory": 16, "renderer": "RTX 3060", "batteryLevel": antic.FINGERPRINT_BATTERY_LEVEL, "pointer": "fine"}
+    assert "\u2028" not in script
+
+    again = antic.fingerprint_script(vendor, 8, 16, hardware={"mouse": "Touchpad", "battery": "76Wh", "hw_gpu": "RTX 3060"})
+    assert again is script
+
+    assert embedded_values(antic.fingerprint_script("Google Inc.", 4, 8, is_touch=True))["pointer"] == "coarse"
+
+
+def test_fingerprint_touch_devices_report_a_coarse_pointer():
+    phone = embedded_values(antic.fingerprint_script("Apple Computer, Inc.", 6, 8, is_touch=True, hardware={"mouse": "Touch"}))
+    assert phone["pointer"] == "coarse"
+    touch_laptop = embedded_values(antic.fingerprint_script("Google Inc.", 8, 16, is_touch=True, hardware={"mouse": "Touchpad"}))
+    assert touch_laptop["pointer"] == "fine"
+
+
+class FakePage:
+    def __init__(self):
+        self.evaluated = []
+
+    async def evaluate(self, expression):
+        self.evaluated.append(expression)
+
+    async def goto(self, url):
+        self.url = url
+
+
+class FakeContext:
+    def __init__(self):
+        self.scripts = []
+        self.pages = []
+
+    async def add_init_script(self, script):
+        self.scripts.append(script)
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def new_page(self):
+        self.pages.append(FakePage())
+        return self.pages[-1]
+
+    async def cookies(self):
+        return []
+
+    async def close(self):
+        pass
+
+
+class FakeLauncher:
+    def __init__(self):
+        self.context = FakeContext()
+
+    async def start(self):
+        pass
+
+    async def browser(self, headless, args):
+        return self
+
+    async def open_context(self, browser, **options):
+        return self.context
+
+
+def test_run_browser_injects_one_script(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cookies").mkdir()
+    launcher = FakeLauncher()
+    timings = {}
+    asyncio.run(antic.run_browser("UA", 1080, 1920, "UTC", "en-US", False, False, True, "Google Inc.", 6, 8, False, "Profile 1.json", launcher=launcher, wait_close=False, timings=timings, hardware={"hw_gpu": "RTX 3060"}))
+
+    assert len(launcher.context.scripts) == 1
+    assert embedded_values(launcher.context.scripts[0])["renderer"] == "RTX 3060"
+    assert launcher.context.pages[0].evaluated == []
+    assert 0 <= timings["fingerprint"] <= timings["context"]
+
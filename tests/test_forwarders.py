@@ -0,0 +1,41 @@
+import asyncio
+import importlib.util
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_forwarders_allocate_distinct_ports():
+    async def run():
+        forwarders = antic.ProxyForwarders()
+        ports = [await forwarders.start(f"Profile {n}.json", "socks5", "192.0.2.1", 1080, "user", "pass") for n in range(5)]
+        running = forwarders.running()
+
+        _, writer = await asyncio.open_connection("127.0.0.1", ports[0])
+        writer.close()
+
+        await forwarders.stop("Profile 0.json")
+        after_stop = forwarders.running()
+        await forwarders.stop_all()
+        return ports, running, after_stop, forwarders.running()
+
+    ports, running, after_stop, final = asyncio.run(run())
+    assert len(set(ports)) == 5
+    assert all(port > 0 for port in ports)
+    assert running["Profile 3.json"] == ports[3]
+    assert "Profile 0.json" not in after_stop
+    assert final == {}
+
+
+def test_forwarders_restart_same_profile():
+    async def run():
+        forwarders = antic.ProxyForwarders()
+        await forwarders.start("Profile 1.json", "socks5", "192.0.2.1", 1080, "user", "pass")
+        await forwarders.start("Profile 1.json", "socks5", "192.0.2.2", 1080, "user", "pass")
+        running = forwarders.running()
+        await forwarders.stop_all()
+        return running
+
+    assert len(asyncio.run(run())) == 1
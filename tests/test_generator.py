@@ -0,0 +1,85 @@
+import collections
+import importlib.util
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+HARDWARE = {
+    "ASUS": {"laptop": {"mainboards": {
+        "ROG STRIX B550": {"cpu": ["Ryzen 5 5600X"], "ram": ["16GB"], "gpu": ["RTX 3060"], "sound": ["Realtek ALC1220"]},
+        "TUF Gaming B560M": {"cpu": ["Intel i5-11400"], "ram": ["4GB"], "gpu": ["GTX 1660"], "sound": ["Realtek ALC897"]},
+    }}},
+    "GOOGLE": {"phone": {"mainboards": {"Tensor G2": {"cpu": ["Tensor G2"], "ram": ["8GB"], "gpu": ["Mali"], "sound": ["Generic"]}}}},
+}
+MODELS = {
+    "ASUS": {"models": {"Zephyrus G14": {"mainboards": ["ROG STRIX B550"], "mouse": ["Touchpad"], "battery": ["76Wh"]}}},
+    "GOOGLE": {"models": {"Pixel 8": {"mainboards": ["Tensor G2"], "mouse": ["Touch"], "battery": ["4300mAh"]}}},
+}
+DEVICES = {
+    "Windows": {"laptop": ["ASUS", "Dell"], "pc": ["ASUS"]},
+    "Android": {"phone": ["Google"]},
+}
+
+
+def make_generator(weights=None):
+    return antic.ProfileGenerator(antic.HardwareCatalog.from_data(HARDWARE, MODELS, DEVICES), weights)
+
+
+def test_generator_builds_consistent_chains():
+    generator = make_generator()
+    chains = sorted(tuple(levels.values()) for levels, _, _ in generator.chains)
+    assert chains == [
+        ("Android", "phone", "Google", "Pixel 8", "Tensor G2"),
+        ("Windows", "laptop", "ASUS", "", "TUF Gaming B560M"),
+        ("Windows", "laptop", "ASUS", "Zephyrus G14", "ROG STRIX B550"),
+    ]
+
+    for profile in generator.generate(200, seed=1, user_agent="UA"):
+        specs = HARDWARE[profile["manufacturer"].upper()][profile["device_type"]]["mainboards"][profile["mainboard"]]
+        assert profile["hw_cpu"] in specs["cpu"] and profile["hw_gpu"] in specs["gpu"]
+        assert profile["is_touch"] == (profile["device_type"] == "phone")
+        assert profile["ram"] == min(int(profile["hw_ram"][:-2]), 8)
+        assert profile["timezone"] in antic.pytz.country_timezones[profile["lang"][-2:]]
+        if profile["model"]:
+            assert profile["mouse"] and profile["battery"]
+
+
+def test_generated_user_agent_and_screen_match_the_device():
+    for profile in make_generator().generate(200, seed=2, user_agent=antic.DEFAULT_USER_AGENT):
+        screen = f"{profile['screen_width']}×{profile['screen_height']}"
+        assert "Chrome/138.0.0.0" in profile["user-agent"]
+        if profile["os"] == "Android":
+            assert "Android" in profile["user-agent"] and "Mobile" in profile["user-agent"]
+            assert screen in antic.PHONE_SCREENS
+        else:
+            assert "Windows NT" in profile["user-agent"]
+            assert screen in antic.SCREENS
+
+    assert "iPad" in antic.user_agent_for("iOS", "tablet", antic.DEFAULT_USER_AGENT)
+    assert "Mobile" not in antic.user_agent_for("Android", "tablet", antic.DEFAULT_USER_AGENT)
+    assert antic.user_agent_for("Android", "phone", "UA") == "UA"
+
+
+def test_generator_is_reproducible_and_weighted():
+    generator = make_generator({"os": {"Windows": 3, "Android": 1}, "lang": {"en-US": 1, "zh-CN": 0}})
+    first = generator.generate(2000, seed=7, user_agent="UA")
+    assert first == generator.generate(2000, seed=7, user_agent="UA")
+    assert first != generator.generate(2000, seed=8, user_agent="UA")
+
+    oses = collections.Counter(profile["os"] for profile in first)
+    assert 0.7 < oses["Windows"] / 2000 < 0.8
+    assert not any(profile["lang"] == "zh-CN" for profile in first)
+
+
+def test_generated_profiles_saved_in_one_batch(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    catalog = antic.ProfileCatalog(str(config_dir), str(tmp_path / "profile_index.json"))
+    catalog.save("Profile 3.json", {"lang": "en-US"})
+
+    names = catalog.create_many(make_generator().generate(5, seed=3, user_agent="UA"))
+    assert names == [f"Profile {n}.json" for n in range(4, 9)]
+    assert len(catalog.profiles()) == 6
+    assert catalog.load("Profile 4.json")["user-agent"] == "UA"
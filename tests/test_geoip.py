@@ -0,0 +1,162 @@
+import importlib.util
+import ipaddress
+import pathlib
+from types import SimpleNamespace
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+class FakeReader:
+    def __init__(self):
+        self.calls = 0
+
+    def country(self, ip):
+        self.calls += 1
+        if ip.startswith("10."):
+            raise antic.geoip2.errors.AddressNotFoundError(ip)
+        return SimpleNamespace(country=SimpleNamespace(iso_code="DE"))
+
+    def city(self, ip):
+        self.calls += 1
+        if ip.startswith("10."):
+            raise antic.geoip2.errors.AddressNotFoundError(ip)
+        return SimpleNamespace(city=SimpleNamespace(name="Berlin"), location=SimpleNamespace(latitude=52.52, longitude=13.40))
+
+    def close(self):
+        pass
+
+
+def make_service(cache_size=2):
+    service = antic.GeoIPService(cache_size=cache_size)
+    reader = FakeReader()
+    service._readers = (reader, reader)
+    return service, reader
+
+
+def test_lookup_caches_and_counts():
+    service, reader = make_service()
+    first = service.lookup("1.2.3.4")
+    first["latency"] = 10
+    second = service.lookup("1.2.3.4")
+    assert second["country_code"] == "DE"
+    assert "latency" not in second
+    assert reader.calls == 2
+    assert service.stats()["hits"] == 1
+    assert service.stats()["misses"] == 1
+
+
+def test_lookup_unknown_address():
+    service, _ = make_service()
+    info = service.lookup("10.0.0.1")
+    assert info == {"country_code": "UNK", "city": "UNK", "timezone": None}
+
+
+def test_lookup_many_dedups_and_evicts():
+    service, reader = make_service(cache_size=2)
+    results = service.lookup_many(["10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"])
+    assert list(results) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+    assert reader.calls == 6
+    assert service.stats()["size"] == 2
+
+
+class FakeFinder:
+    def __init__(self):
+        self.calls = 0
+
+    def timezone_at(self, lat, lng):
+        self.calls += 1
+        return "Europe/Berlin" if lng > 0 else "America/New_York"
+
+
+def test_timezone_resolver_caches_cells():
+    resolver = antic.TimezoneResolver(cell_size=0.1)
+    resolver._finder = FakeFinder()
+    coords = [(52.52, 13.40), (52.53, 13.41), (40.71, -74.0), (None, None)]
+    assert resolver.resolve_many(coords) == ["Europe/Berlin", "Europe/Berlin", "America/New_York", None]
+    assert resolver.resolve(40.7, -74.01) == "America/New_York"
+    assert resolver._finder.calls == 2
+
+
+mmdb_spec = importlib.util.spec_from_file_location("mmdb_writer", pathlib.Path(__file__).resolve().parents[1] / "benchmarks" / "mmdb_writer.py")
+mmdb_writer = importlib.util.module_from_spec(mmdb_spec)
+mmdb_spec.loader.exec_module(mmdb_writer)
+NETWORK = ipaddress.IPv4Network("11.0.0.0/24")
+
+
+def write_country(path, code, build_epoch, database_type="GeoLite2-Country"):
+    mmdb_writer.write_mmdb(str(path), database_type, [(NETWORK, {"country": {"iso_code": code}})], build_epoch=build_epoch)
+
+
+def test_swap_lets_running_lookups_finish():
+    service, old = make_service(cache_size=4)
+    new = FakeReader()
+
+    class SwappingReader(FakeReader):
+        def country(self, ip):
+            service.swap(country=new, city=new)
+            return super().country(ip)
+
+    service._readers = (SwappingReader(), old)
+    assert service.lookup("1.2.3.4")["country_code"] == "DE"
+    assert service.stats()["size"] == 0
+    service.lookup("1.2.3.4")
+    assert new.calls == 2
+
+
+def test_missing_databases_answer_unknown(tmp_path):
+    service = antic.GeoIPService(tmp_path / "country.mmdb", tmp_path / "city.mmdb")
+    assert service.lookup("11.0.0.1") == {"country_code": "UNK", "city": "UNK", "timezone": None}
+
+
+def test_manager_swaps_in_newer_valid_databases(tmp_path):
+    service = antic.GeoIPService(tmp_path / "missing-country.mmdb", tmp_path / "missing-city.mmdb")
+    manager = antic.GeoIPDatabaseManager(service, drop_dir=tmp_path / "drop", urls=None)
+    (tmp_path / "drop").mkdir()
+    write_country(tmp_path / "drop" / "a.mmdb", "DE", 100)
+    (tmp_path / "drop" / "broken.mmdb").write_bytes(b"not a database")
+    write_country(tmp_path / "drop" / "isp.mmdb", "FR", 500, database_type="GeoIP2-ISP")
+
+    assert manager.reload() == {"country": str(tmp_path / "drop" / "a.mmdb")}
+    assert set(manager.rejected) == {str(tmp_path / "drop" / "broken.mmdb"), str(tmp_path / "drop" / "isp.mmdb")}
+    assert service.lookup("11.0.0.1")["country_code"] == "DE"
+    assert manager.reload() == {}
+
+    write_country(tmp_path / "drop" / "older.mmdb", "PL", 50)
+    write_country(tmp_path / "drop" / "newer.mmdb", "NL", 200)
+    assert manager.reload() == {"country": str(tmp_path / "drop" / "newer.mmdb")}
+    assert service.lookup("11.0.0.1")["country_code"] == "NL"
+
+
+def test_manager_downloads_missing_databases_atomically(tmp_path, monkeypatch):
+    write_country(tmp_path / "source.mmdb", "US", 100)
+    data = (tmp_path / "source.mmdb").read_bytes()
+
+    class Response:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            pass
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, size):
+            return (data[i:i + size] for i in range(0, len(data), size))
+
+    def fake_get(url, **kwargs):
+        if "City" in url:
+            raise antic.requests.ConnectionError("offline")
+        return Response()
+
+    monkeypatch.setattr(antic.requests, "get", fake_get)
+    service = antic.GeoIPService(tmp_path / "missing-country.mmdb", tmp_path / "missing-city.mmdb")
+    manager = antic.GeoIPDatabaseManager(service, drop_dir=tmp_path / "drop")
+    manager.download_missing()
+
+    assert sorted(path.name for path in (tmp_path / "drop").iterdir()) == ["GeoLite2-Country.mmdb"]
+    assert set(manager.loaded) == {"country"}
+    assert set(manager.errors) == {"city"}
+    assert service.lookup("11.0.0.1")["country_code"] == "US"
@@ -0,0 +1,89 @@
+import importlib.util
+import json
+import os
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+HARDWARE = {
+    "APPLE": {
+        "laptop": {"mainboards": {"M1": {"cpu": ["Apple M1"], "ram": ["8GB", "16GB"], "gpu": ["Integrated"], "sound": ["Apple Sound"]}}},
+        "phone": {"mainboards": {"A14": {"cpu": ["A14 Bionic"], "ram": ["4GB"], "gpu": ["Apple GPU"], "sound": ["Apple Sound"]}}},
+    },
+    "GOOGLE": {"phone": {"mainboards": {"Tensor G2": {"cpu": ["Tensor G2"], "ram": ["8GB"], "gpu": ["Mali"]}}}},
+}
+MODELS = {
+    "Apple": {"models": {
+        "MacBook Air": {"mainboards": ["M1"], "mouse": ["Touchpad"], "battery": ["49.9Wh"]},
+        "iPhone 14": {"mainboards": ["A14"], "mouse": ["Touch"], "battery": ["3200mAh"]},
+        "iPhone 99": {"mainboards": ["A99"]},
+    }},
+    "GOOGLE": {"models": {"Pixel 8": {"mainboards": ["Tensor G2"], "mouse": ["Touch"], "battery": ["4300mAh"]}}},
+}
+DEVICES = {
+    "iOS": {"phone": ["APPLE"]},
+    "Android": {"phone": ["Google", "Samsung"]},
+}
+
+
+def test_catalog_cascade():
+    catalog = antic.HardwareCatalog.from_data(HARDWARE, MODELS, DEVICES)
+    assert catalog.values("os") == ["iOS", "Android"]
+    assert catalog.values("manufacturer", {"os": "Android", "device_type": "phone"}) == ["Google", "Samsung"]
+
+    selection = {"os": "Android", "device_type": "phone", "manufacturer": "Google"}
+    assert catalog.values("model", selection) == ["Pixel 8"]
+    selection.update(model="Pixel 8", mainboard="Tensor G2")
+    assert catalog.values("mainboard", selection) == ["Tensor G2"]
+    assert catalog.values("cpu", selection) == ["Tensor G2"]
+    assert catalog.values("battery", selection) == ["4300mAh"]
+
+    assert catalog.values("model", {"device_type": "phone", "manufacturer": "apple"}) == ["iPhone 14"]
+    assert catalog.values("model", {"device_type": "laptop", "manufacturer": "APPLE"}) == ["MacBook Air"]
+    assert catalog.values("model", {"device_type": "tablet", "manufacturer": "APPLE"}) == []
+
+    assert catalog.options("os") is catalog.options("os")
+    assert [option.key for option in catalog.options("os")] == ["iOS", "Android"]
+
+
+def test_catalog_reports_problems():
+    catalog = antic.HardwareCatalog.from_data(HARDWARE, MODELS, DEVICES)
+    problems = "\n".join(catalog.problems)
+    assert "GOOGLE/phone/Tensor G2 has no sound list" in problems
+    assert "APPLE/iPhone 99 lists unknown mainboard A99" in problems
+    assert "Android/phone/Samsung has no mainboards" in problems
+    assert len(catalog.problems) == 3
+
+
+def test_catalog_skips_malformed_device_types():
+    hardware = {**HARDWARE, "SAMSUNG": {"phone": ["Exynos"], "tablet": "Exynos"}}
+    catalog = antic.HardwareCatalog.from_data(hardware, MODELS, DEVICES)
+    problems = "\n".join(catalog.problems)
+    assert "SAMSUNG/phone is not an object" in problems
+    assert "SAMSUNG/tablet is not an object" in problems
+    assert catalog.values("model", {"device_type": "phone", "manufacturer": "Google"}) == ["Pixel 8"]
+
+
+def test_catalog_disk_cache_follows_mtime(tmp_path, monkeypatch):
+    paths = {"HARDWARE_DATA_PATH": HARDWARE, "LAPTOP_MODELS_PATH": MODELS, "DEVICE_DATA_PATH": DEVICES}
+    for name, data in paths.items():
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        monkeypatch.setattr(antic, name, str(path))
+    cache_path = str(tmp_path / "cache.json")
+
+    built = antic.HardwareCatalog.load(cache_path)
+    monkeypatch.setattr(antic.HardwareCatalog, "from_data", classmethod(lambda cls, *args: 1 / 0))
+    cached = antic.HardwareCatalog.load(cache_path)
+    assert cached.index == built.index
+    assert cached.problems == built.problems
+
+    monkeypatch.undo()
+    monkeypatch.setattr(antic, "DEVICE_DATA_PATH", str(tmp_path / "DEVICE_DATA_PATH.json"))
+    monkeypatch.setattr(antic, "HARDWARE_DATA_PATH", str(tmp_path / "HARDWARE_DATA_PATH.json"))
+    monkeypatch.setattr(antic, "LAPTOP_MODELS_PATH", str(tmp_path / "LAPTOP_MODELS_PATH.json"))
+    (tmp_path / "DEVICE_DATA_PATH.json").write_text(json.dumps({"iOS": {"phone": ["APPLE"]}}), encoding="utf-8")
+    os.utime(tmp_path / "DEVICE_DATA_PATH.json", ns=(1, 1))
+    assert antic.HardwareCatalog.load(cache_path).values("os") == ["iOS"]
@@ -0,0 +1,46 @@
+import importlib.util
+import pathlib
+import subprocess
+import sys
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+HEAVY_MODULES = {"flet", "playwright", "pproxy", "geoip2", "maxminddb", "timezonefinder", "pytz", "requests"}
+# Cumulative microseconds reported by -X importtime for "import antic",
+# best of three runs. The eager imports used to take over 400 ms.
+IMPORT_TIME_BUDGET = 200_000
+
+
+def import_antic() -> tuple:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import antic"],
+        cwd=pathlib.Path(spec.origin).parent, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules["antic"], {name.partition(".")[0] for name in modules}
+
+
+def test_import_skips_heavy_dependencies():
+    _, packages = import_antic()
+    assert packages & HEAVY_MODULES == set()
+
+
+def test_import_time_budget():
+    best = min(import_antic()[0] for _ in range(3))
+    assert best < IMPORT_TIME_BUDGET, f"import antic took {best / 1000:.1f} ms"
+
+
+def test_lazy_module_imports_on_first_use(monkeypatch):
+    lazy = antic._LazyModule("json", "json.decoder")
+    assert lazy.loads("[1]") == [1]
+    assert lazy.decoder.JSONDecodeError is antic.json.JSONDecodeError
+
+    monkeypatch.setattr(lazy, "dumps", lambda value: "patched")
+    assert antic.json.dumps([1]) == "patched"
@@ -0,0 +1,86 @@
+import asyncio
+import importlib.util
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+class FakeBrowser:
+    def __init__(self, headless, args):
+        self.headless = headless
+        self.args = args
+        self.contexts = []
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    async def new_context(self, **options):
+        await asyncio.sleep(0)
+        self.contexts.append(options)
+        return options
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, headless, args):
+        browser = FakeBrowser(headless, args)
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def test_launcher_pools_browsers_by_launch_options():
+    async def run():
+        launcher = antic.BrowserLauncher(contexts_per_browser=2)
+        playwright = launcher._playwright = FakePlaywright()
+        for n in range(3):
+            await launcher.new_context(headless=True, locale=f"en-{n}")
+        await launcher.new_context(headless=True, args=antic.BROWSER_ARGS + ("--disable-webgl",))
+        await launcher.close()
+        return playwright
+
+    playwright = asyncio.run(run())
+    launched = playwright.chromium.launched
+    assert len(launched) == 3
+    assert [len(b.contexts) for b in launched] == [2, 1, 1]
+    assert "--disable-webgl" in launched[2].args
+    assert all(b.closed for b in launched)
+    assert playwright.stopped
+
+
+def test_launcher_spreads_concurrent_contexts():
+    async def run():
+        launcher = antic.BrowserLauncher(contexts_per_browser=2)
+        playwright = launcher._playwright = FakePlaywright()
+        await asyncio.gather(*(launcher.new_context(headless=True) for _ in range(6)))
+        assert launcher._reserved == {}
+        return playwright
+
+    assert [len(b.contexts) for b in asyncio.run(run()).chromium.launched] == [2, 2, 2]
+
+
+def test_launcher_warm():
+    async def run():
+        launcher = antic.BrowserLauncher()
+        playwright = launcher._playwright = FakePlaywright()
+        await launcher.warm(2, headless=True)
+        await launcher.new_context(headless=True)
+        return playwright
+
+    assert len(asyncio.run(run()).chromium.launched) == 2
@@ -0,0 +1,68 @@
+import asyncio
+import importlib.util
+import json
+import pathlib
+import urllib.request
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = antic.Metrics()
+    metrics.inc("requests_total")
+    metrics.observe("latency_seconds", 1.0)
+    with metrics.timer("block_seconds"):
+        pass
+    assert metrics.timer("block_seconds") is antic._NULL_TIMER
+    assert metrics.counters == {} and metrics.timers == {}
+    assert metrics.prometheus() == "\n"
+
+
+def test_metrics_prometheus_and_sink(tmp_path):
+    metrics = antic.Metrics()
+    sink = tmp_path / "metrics.jsonl"
+    metrics.enable(str(sink))
+
+    @metrics.timed("work_seconds", kind="async")
+    async def work():
+        return 42
+
+    assert asyncio.run(work()) == 42
+    metrics.inc("checks_total", alive="true")
+    metrics.inc("checks_total", 2, alive="true")
+    metrics.inc("checks_total", note='say "hi"\n')
+    metrics.event("forwarder_events_total", message="socks5 127.0.0.1:1 -> example.com:80")
+    metrics.disable()
+
+    text = metrics.prometheus()
+    assert "# TYPE checks_total counter\n" in text
+    assert 'checks_total{alive="true"} 3\n' in text
+    assert 'checks_total{note="say \\"hi\\"\\n"} 1\n' in text
+    assert 'work_seconds_count{kind="async"} 1\n' in text
+    assert "forwarder_events_total 1\n" in text
+
+    records = [json.loads(line) for line in sink.read_text(encoding="utf-8").splitlines()]
+    assert [record["type"] for record in records] == ["timer", "counter", "counter", "counter", "event"]
+    assert records[-1]["message"].startswith("socks5")
+
+
+def test_metrics_http_endpoint_and_geoip_counters(monkeypatch):
+    metrics = antic.Metrics()
+    monkeypatch.setattr(antic, "metrics", metrics)
+    metrics.enable()
+
+    service = antic.GeoIPService(cache_size=4)
+    monkeypatch.setattr(service, "_locate", lambda ip, readers: ({"country_code": "UNK", "city": "UNK", "timezone": None}, (None, None)))
+    service.lookup("10.0.0.1")
+    service.lookup("10.0.0.1")
+
+    server = metrics.serve(port=0)
+    try:
+        port = server.server_address[1]
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode("utf-8")
+    finally:
+        server.shutdown()
+    assert 'antic_geoip_lookups_total{cache="hit"} 1' in body
+    assert 'antic_geoip_lookups_total{cache="miss"} 1' in body
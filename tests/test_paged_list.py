@@ -0,0 +1,43 @@
+import importlib.util
+import pathlib
+from types import SimpleNamespace
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_paged_list_builds_rows_lazily():
+    built = []
+    prepared = []
+
+    def build_row(key):
+        built.append(key)
+        return antic.ft.Text(key)
+
+    keys = [f"Profile {n}.json" for n in range(120)]
+    paged = antic.PagedList(keys, build_row, page_size=50, prepare=prepared.append)
+    assert len(paged.view.controls) == 50
+    assert prepared == [keys[:50]]
+
+    paged._on_scroll(SimpleNamespace(pixels=0, max_scroll_extent=10000))
+    assert len(built) == 50
+    paged._on_scroll(SimpleNamespace(pixels=9800, max_scroll_extent=10000))
+    assert len(paged.view.controls) == 100
+
+    paged.append("New.json")
+    assert "New.json" not in paged.rows
+
+
+def test_paged_list_row_updates_touch_one_control():
+    paged = antic.PagedList(["a", "b", "c"], antic.ft.Text)
+    first, last = paged.view.controls[0], paged.view.controls[2]
+
+    paged.refresh_row("b")
+    paged.remove("a")
+    paged.append("d")
+
+    assert paged.keys == ["b", "c", "d"]
+    assert paged.view.controls[1] is last
+    assert first not in paged.view.controls
+    assert len(paged.view.controls) == 3
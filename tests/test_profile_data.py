@@ -0,0 +1,139 @@
+import asyncio
+import importlib.util
+import os
+import pathlib
+
+import pytest
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def fill(store, profile, cache=0, storage=0, mtime=None):
+    root = pathlib.Path(store.open(profile))
+    store.active.discard(profile)
+    (root / "Default" / "Cache").mkdir(parents=True, exist_ok=True)
+    (root / "Default" / "Cache" / "data_0").write_bytes(b"c" * cache)
+    (root / "Default" / "Local Storage").mkdir(parents=True, exist_ok=True)
+    (root / "Default" / "Local Storage" / "leveldb").write_bytes(b"s" * storage)
+    if mtime is not None:
+        os.utime(root, (mtime, mtime))
+
+
+def test_store_enforces_profile_quota(tmp_path):
+    store = antic.ProfileDataStore(str(tmp_path), profile_quota=1000, total_quota=10**9)
+    fill(store, "big.json", cache=1500, storage=100)
+    fill(store, "small.json", cache=500)
+
+    assert store.enforce() == 1500
+    assert store.size("big.json") == 100
+    assert store.cache_size("small.json") == 500
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = antic.ProfileDataStore(str(tmp_path), profile_quota=10**9, total_quota=2500)
+    fill(store, "old.json", cache=1000, storage=10, mtime=1000)
+    fill(store, "open.json", cache=1000, mtime=500)
+    fill(store, "new.json", cache=1000, mtime=3000)
+    store.active.add("open.json")
+
+    assert store.enforce() == 1000
+    assert store.cache_size("old.json") == 0 and store.size("old.json") == 10
+    assert store.cache_size("open.json") == 1000
+    assert store.cache_size("new.json") == 1000
+
+    store.active.clear()
+    store.remove("new.json")
+    assert not os.path.exists(store.path("new.json"))
+
+
+class FakeSession:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def send(self, method):
+        self.handlers["Network.responseReceived"]({"requestId": "1", "response": {"fromDiskCache": True}})
+        self.handlers["Network.responseReceived"]({"requestId": "2", "response": {}})
+        self.handlers["Network.dataReceived"]({"requestId": "1", "dataLength": 700})
+        self.handlers["Network.dataReceived"]({"requestId": "2", "dataLength": 300})
+
+
+class FakePage:
+    async def goto(self, url):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = [FakePage()]
+
+    async def add_init_script(self, script):
+        pass
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def new_cdp_session(self, page):
+        return FakeSession()
+
+    async def cookies(self):
+        return []
+
+    async def close(self):
+        pass
+
+
+class FakeLauncher:
+    async def start(self):
+        pass
+
+    async def persistent_context(self, user_data_dir, headless, args, **options):
+        self.user_data_dir = user_data_dir
+        self.options = options
+        return FakeContext()
+
+
+def test_run_browser_persistent_reports_savings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cookies").mkdir()
+    store = antic.ProfileDataStore(str(tmp_path / "data"), profile_quota=10**9, total_quota=10**9)
+    fill(store, "Profile 1.json", cache=50)
+    launcher = FakeLauncher()
+    usage = {}
+    asyncio.run(antic.run_browser("UA", 1080, 1920, "UTC", "en-US", False, False, True, "Google Inc.", 6, 8, False, "Profile 1.json", launcher=launcher, wait_close=False, persistent=True, data_store=store, usage=usage))
+
+    assert launcher.user_data_dir == store.path("Profile 1.json")
+    assert launcher.options["locale"] == "en-US"
+    assert usage == {"warm": True, "cached_responses": 1, "bytes_saved": 700, "evicted": 0}
+    assert store.active == set()
+
+
+def test_run_browser_cleans_up_when_saving_cookies_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cookies").mkdir()
+    store = antic.ProfileDataStore(str(tmp_path / "data"), profile_quota=10**9, total_quota=10**9)
+    stopped = []
+
+    class CrashedContext(FakeContext):
+        async def cookies(self):
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    class CrashLauncher(FakeLauncher):
+        async def persistent_context(self, user_data_dir, headless, args, **options):
+            return CrashedContext()
+
+    async def stop(profile):
+        stopped.append(profile)
+
+    monkeypatch.setattr(antic.proxy_forwarders, "stop", stop)
+    usage = {}
+    with pytest.raises(RuntimeError):
+        asyncio.run(antic.run_browser("UA", 1080, 1920, "UTC", "en-US", False, False, True, "Google Inc.", 6, 8, False, "Profile 1.json", launcher=CrashLauncher(), wait_close=False, persistent=True, data_store=store, usage=usage))
+
+    assert stopped == ["Profile 1.json"]
+    assert store.active == set()
+    assert usage["evicted"] == 0
@@ -0,0 +1,75 @@
+import importlib.util
+import json
+import os
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def make_catalog(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir(exist_ok=True)
+    return antic.ProfileCatalog(str(config_dir), str(tmp_path / "profile_index.json"))
+
+
+def test_catalog_indexes_and_searches(tmp_path):
+    catalog = make_catalog(tmp_path)
+    catalog.save("Profile 1.json", {"lang": "en-US", "timezone": "America/New_York", "proxy": False, "os": "Windows"})
+    catalog.save("Profile 2.json", {"lang": "ru-RU", "timezone": "Europe/Moscow", "proxy": "socks5://1.2.3.4:1080", "os": "Windows"})
+    catalog.save("Work.json", {"lang": "en-US", "timezone": "Europe/London", "proxy": False, "os": "MacOS"})
+
+    assert list(catalog.profiles()) == ["Profile 1.json", "Profile 2.json", "Work.json"]
+    assert catalog.search(lang="en-US") == ["Profile 1.json", "Work.json"]
+    assert catalog.search(lang="en-US", os="Windows") == ["Profile 1.json"]
+    assert catalog.search("moscow") == ["Profile 2.json"]
+    assert catalog.search(proxy="") == ["Profile 1.json", "Work.json"]
+    assert catalog.next_name() == "Profile 3.json"
+
+    catalog.delete("Profile 2.json")
+    assert catalog.search(lang="ru-RU") == []
+
+
+def test_catalog_picks_up_external_changes(tmp_path):
+    catalog = make_catalog(tmp_path)
+    catalog.save("Profile 1.json", {"lang": "en-US", "timezone": "UTC"})
+
+    config_dir = tmp_path / "config"
+    (config_dir / "Profile 7.json").write_text(json.dumps({"lang": "fr-FR", "timezone": "Europe/Paris"}), encoding="utf-8")
+    os.remove(config_dir / "Profile 1.json")
+    catalog.refresh(force=True)
+    assert list(catalog.profiles()) == ["Profile 7.json"]
+    assert catalog.next_name() == "Profile 8.json"
+
+    reopened = make_catalog(tmp_path)
+    assert reopened.entries == catalog.entries
+    assert reopened.search(lang="fr-FR") == ["Profile 7.json"]
+
+
+def test_catalog_skips_unchanged_files(tmp_path, monkeypatch):
+    catalog = make_catalog(tmp_path)
+    for n in range(1, 4):
+        catalog.save(f"Profile {n}.json", {"lang": "en-US", "timezone": "UTC"})
+
+    reopened = make_catalog(tmp_path)
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda path, *args, **kwargs: opened.append(path) or real_open(path, *args, **kwargs))
+    reopened.refresh(force=True)
+    assert not [path for path in opened if str(path).endswith("json") and "Profile" in str(path)]
+
+
+def test_catalog_picks_up_in_place_edits(tmp_path):
+    (tmp_path / "config").mkdir()
+    catalog = antic.ProfileCatalog(str(tmp_path / "config"), str(tmp_path / "profile_index.json"), rescan_interval=0)
+    catalog.save("Profile 1.json", {"lang": "en-US", "timezone": "UTC", "proxy": False})
+
+    path = tmp_path / "config" / "Profile 1.json"
+    dir_mtime = os.stat(tmp_path / "config").st_mtime_ns
+    path.write_text(json.dumps({"lang": "de-DE", "timezone": "Europe/Berlin", "proxy": "socks5://1.2.3.4:1080"}), encoding="utf-8")
+    os.utime(path, ns=(dir_mtime + 10**9, dir_mtime + 10**9))
+    assert os.stat(tmp_path / "config").st_mtime_ns == dir_mtime
+
+    assert make_catalog(tmp_path).search(lang="de-DE") == ["Profile 1.json"]
+    assert catalog.profiles()["Profile 1.json"]["proxy"] == "socks5://1.2.3.4:1080"
@@ -0,0 +1,70 @@
+import importlib.util
+import pathlib
+import time
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def proxy(n, country, timezone, latency=100, alive=True):
+    return {"proxy": f"http://10.0.0.{n}:8080", "alive": alive, "latency": latency, "country_code": country, "timezone": timezone}
+
+
+def test_assign_prefers_timezone_then_country():
+    proxies = [
+        proxy(1, "US", "America/New_York", latency=50),
+        proxy(2, "US", "America/Chicago", latency=20),
+        proxy(3, "RU", "Europe/Moscow", alive=False),
+        proxy(4, "GB", "Europe/London"),
+    ]
+    profiles = {
+        "ny": {"lang": "en-US", "timezone": "America/New_York", "proxy": ""},
+        "la": {"lang": "en-US", "timezone": "America/Los_Angeles", "proxy": ""},
+        "moscow": {"lang": "ru-RU", "timezone": "Europe/Moscow", "proxy": ""},
+        "kept": {"lang": "fr-FR", "timezone": "Europe/Paris", "proxy": "http://10.0.0.4:8080"},
+    }
+    assignment = antic.assign_proxies(profiles, proxies, max_per_proxy=2)
+    assert assignment == {"ny": "http://10.0.0.1:8080", "la": "http://10.0.0.2:8080", "moscow": None}
+
+    assignment = antic.assign_proxies(profiles, proxies, max_per_proxy=2, fallback=True)
+    assert assignment["moscow"] == "http://10.0.0.2:8080"
+
+
+def test_assign_respects_cap_and_balances():
+    proxies = [proxy(n, "US", "America/New_York", latency=n) for n in range(1, 4)]
+    profiles = {f"p{n}": {"lang": "en-US", "timezone": "America/New_York", "proxy": ""} for n in range(8)}
+    assignment = antic.assign_proxies(profiles, proxies, max_per_proxy=2)
+    used = [url for url in assignment.values() if url]
+    assert len(used) == 6
+    assert all(used.count(url) == 2 for url in set(used))
+    assert list(assignment.values())[:3] == [p["proxy"] for p in proxies]
+
+
+def test_assign_scales_to_large_inputs():
+    timezones = ["America/New_York", "Europe/London", "Europe/Paris", "Europe/Moscow", "Asia/Shanghai"]
+    countries = ["US", "GB", "FR", "RU", "CN"]
+    proxies = [{"proxy": f"http://10.{n // 65536}.{n // 256 % 256}.{n % 256}:8080", "alive": True, "latency": n % 300, "country_code": countries[n % 5], "timezone": timezones[n % 5]} for n in range(10000)]
+    langs = ["en-US", "en-GB", "fr-FR", "ru-RU", "zh-CN"]
+    profiles = {f"Profile {n}.json": {"lang": langs[n % 5], "timezone": timezones[(n + n // 5) % 5], "proxy": ""} for n in range(10000)}
+
+    started = time.perf_counter()
+    assignment = antic.assign_proxies(profiles, proxies, max_per_proxy=1)
+    assert time.perf_counter() - started < 5
+    assert all(assignment.values())
+    assert len(set(assignment.values())) == 10000
+
+
+def test_catalog_assign_proxies_updates_profiles(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    catalog = antic.ProfileCatalog(str(config_dir), str(tmp_path / "profile_index.json"))
+    catalog.save_many({
+        "Profile 1.json": {"lang": "en-GB", "timezone": "UTC", "proxy": False, "cpu": 4},
+        "Profile 2.json": {"lang": "zh-CN", "timezone": "Asia/Shanghai", "proxy": False},
+    })
+
+    assignment = catalog.assign_proxies([proxy(1, "GB", "Europe/London")])
+    assert assignment == {"Profile 1.json": "http://10.0.0.1:8080", "Profile 2.json": None}
+    assert catalog.load("Profile 1.json") == {"lang": "en-GB", "timezone": "Europe/London", "proxy": "http://10.0.0.1:8080", "cpu": 4}
+    assert catalog.search(proxy="http://10.0.0.1:8080") == ["Profile 1.json"]
@@ -0,0 +1,72 @@
+import asyncio
+import importlib.util
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_health_histogram_and_score():
+    health = antic.ProxyHealth(history=4)
+    for latency in (30, 120, None, 5000, 90):
+        health.record(latency, "US")
+    assert list(health.samples) == [120, None, 5000, 90]
+    assert health.histogram() == [0, 1, 1, 0, 0, 0, 0, 1]
+    assert health.alive and health.failures == 0
+    assert health.score() > 0
+
+    health.record(None)
+    assert health.failures == 1
+    assert health.score() == 0.0
+
+
+def make_monitor(tmp_path, monkeypatch, results):
+    repository = antic.ProxyRepository(str(tmp_path / "proxies.json"))
+    repository.add_many(list(results))
+
+    async def fake_check(proxy, timeout, verify=False):
+        return dict(results[proxy])
+
+    monkeypatch.setattr(antic, "check_proxy", fake_check)
+    return antic.ProxyMonitor(repository, interval=10, jitter=0.1, max_backoff=35)
+
+
+def test_monitor_schedules_with_backoff(tmp_path, monkeypatch):
+    dead = "http://10.0.0.2:8080"
+    monitor = make_monitor(tmp_path, monkeypatch, {
+        "http://10.0.0.1:8080": {"alive": True, "latency": 80, "country_code": "US"},
+        dead: {"alive": False, "latency": None, "country_code": "US"},
+    })
+    monkeypatch.setattr(antic.time, "monotonic", lambda: 1000.0)
+
+    assert asyncio.run(monitor.run_once()) == 2
+    assert asyncio.run(monitor.run_once()) == 0
+    assert 1009 <= monitor.health["http://10.0.0.1:8080"].next_check <= 1011
+    assert monitor.repository.get(dead)["alive"] is False
+
+    delays = []
+    for _ in range(4):
+        monitor.health[dead].next_check = 0
+        asyncio.run(monitor.run_once())
+        delays.append(monitor.health[dead].next_check - 1000)
+    assert 18 <= delays[0] <= 22
+    assert all(35 * 0.9 <= d <= 35 * 1.1 for d in delays[1:])
+
+
+def test_monitor_picks_best_proxy_per_country(tmp_path, monkeypatch):
+    monitor = make_monitor(tmp_path, monkeypatch, {
+        "http://10.0.0.1:8080": {"alive": True, "latency": 300, "country_code": "US"},
+        "http://10.0.0.2:8080": {"alive": True, "latency": 40, "country_code": "US"},
+        "http://10.0.0.3:8080": {"alive": True, "latency": 10, "country_code": "DE"},
+        "http://10.0.0.4:8080": {"alive": False, "latency": None, "country_code": "US"},
+    })
+    asyncio.run(monitor.run_once())
+
+    assert monitor.best_proxy("US") == "http://10.0.0.2:8080"
+    assert monitor.best_proxy() == "http://10.0.0.3:8080"
+    assert monitor.ranked("US") == ["http://10.0.0.2:8080", "http://10.0.0.1:8080"]
+    assert monitor.best_proxy("FR") is None
+
+    monitor.repository.remove("http://10.0.0.2:8080")
+    assert monitor.best_proxy("US") == "http://10.0.0.1:8080"
@@ -0,0 +1,72 @@
+import importlib.util
+import json
+import pathlib
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_repository_add_remove_keeps_order(tmp_path):
+    path = tmp_path / "proxies.json"
+    repo = antic.ProxyRepository(str(path))
+    for n in range(5):
+        assert repo.add(f"http://10.0.0.{n}:80")
+    assert not repo.add("http://10.0.0.1:80")
+
+    assert repo.remove("http://10.0.0.1:80")
+    assert not repo.remove("http://10.0.0.1:80")
+    assert repo.urls() == ["http://10.0.0.0:80", "http://10.0.0.2:80", "http://10.0.0.3:80", "http://10.0.0.4:80"]
+    assert [e["proxy"] for e in json.loads(path.read_text(encoding="utf-8"))] == repo.urls()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_repository_columnar_query(tmp_path):
+    repo = antic.ProxyRepository(str(tmp_path / "proxies.json"))
+    results = {
+        "socks5://10.0.0.1:1080": {"alive": True, "latency": 40, "country_code": "DE"},
+        "socks5://10.0.0.2:1080": {"alive": True, "latency": 400, "country_code": "DE"},
+        "socks5://10.0.0.3:1080": {"alive": False, "latency": None, "country_code": "US"},
+    }
+    for url, fields in results.items():
+        repo.add(url, save=False)
+        repo.update(url, fields)
+    repo.save()
+
+    assert repo.query(alive=True, country_code="DE") == ["socks5://10.0.0.1:1080", "socks5://10.0.0.2:1080"]
+    assert repo.query(max_latency=100) == ["socks5://10.0.0.1:1080"]
+    assert repo.query(alive=False) == ["socks5://10.0.0.3:1080"]
+    assert repo.get("socks5://10.0.0.3:1080") == {"proxy": "socks5://10.0.0.3:1080", "alive": False, "country_code": "US"}
+
+    repo.remove("socks5://10.0.0.1:1080")
+    assert sorted(repo.columns["latency"], key=str) == [400, None]
+    assert repo.get("socks5://10.0.0.2:1080")["latency"] == 400
+    assert repo.query(alive=True) == ["socks5://10.0.0.2:1080"]
+
+
+def test_repository_does_not_lose_concurrent_writes(tmp_path):
+    path = str(tmp_path / "proxies.json")
+    first = antic.ProxyRepository(path)
+    second = antic.ProxyRepository(path)
+    first.add("http://10.0.0.1:80")
+    second.add("http://10.0.0.2:80")
+    first.remove("http://10.0.0.3:80")
+    assert antic.ProxyRepository(path).urls() == ["http://10.0.0.1:80", "http://10.0.0.2:80"]
+
+
+def test_repository_save_replays_check_results_over_other_writers(tmp_path):
+    path = str(tmp_path / "proxies.json")
+    checker = antic.ProxyRepository(path)
+    checker.add("http://10.0.0.1:80")
+    checker.add("http://10.0.0.3:80")
+    editor = antic.ProxyRepository(path)
+    editor.add("http://10.0.0.2:80")
+    editor.remove("http://10.0.0.3:80")
+
+    checker.update("http://10.0.0.1:80", {"alive": True, "latency": 40})
+    checker.update("http://10.0.0.3:80", {"alive": False})
+    checker.save()
+
+    saved = antic.ProxyRepository(path)
+    assert saved.urls() == ["http://10.0.0.1:80", "http://10.0.0.2:80"]
+    assert saved.get("http://10.0.0.1:80")["latency"] == 40
@@ -0,0 +1,73 @@
+import asyncio
+import importlib.util
+import pathlib
+
+import pproxy
+import pytest
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+BODY = b"x" * 100000
+
+
+async def origin(reader, writer):
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(BODY) + BODY)
+    await writer.drain()
+    writer.close()
+
+
+async def verify_through(server_url, proxy_template, **kwargs):
+    origin_server = await asyncio.start_server(origin, "127.0.0.1", 0)
+    origin_port = origin_server.sockets[0].getsockname()[1]
+    proxy_server = await pproxy.Server(server_url).start_server(dict(rserver=[], verbose=lambda *args: None, authtime=0))
+    proxy_port = proxy_server.sockets[0].getsockname()[1]
+    try:
+        return await antic.verify_proxy(proxy_template.format(port=proxy_port), url=f"http://127.0.0.1:{origin_port}/", timeout=3, **kwargs)
+    finally:
+        proxy_server.close()
+        origin_server.close()
+
+
+@pytest.mark.parametrize("protocol", ["socks5", "http"])
+def test_verify_proxy_with_auth(protocol):
+    result = asyncio.run(verify_through(f"{protocol}://127.0.0.1:0#user:pass", f"{protocol}://user:pass@127.0.0.1:{{port}}", fetch=True))
+    assert result["alive"] is True
+    assert result["error"] is None
+    assert result["status"] == 200
+    assert result["handshake_ms"] is not None and result["ttfb_ms"] is not None
+    assert result["throughput"] > 0
+
+
+@pytest.mark.parametrize("protocol", ["socks5", "http"])
+def test_verify_proxy_rejects_bad_credentials(protocol):
+    result = asyncio.run(verify_through(f"{protocol}://127.0.0.1:0#user:pass", f"{protocol}://user:wrong@127.0.0.1:{{port}}"))
+    assert result["alive"] is False
+    assert result["connect_ms"] is not None
+    assert result["handshake_ms"] is None
+    assert result["error"]
+
+
+def test_verify_proxy_socks4_handshake_only():
+    result = asyncio.run(verify_through("socks4://127.0.0.1:0", "socks4://127.0.0.1:{port}"))
+    assert result["alive"] is True
+    assert result["ttfb_ms"] is None
+
+
+def test_verify_proxy_timeout():
+    async def run():
+        async def silent(reader, writer):
+            await asyncio.sleep(5)
+
+        server = await asyncio.start_server(silent, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await antic.verify_proxy(f"socks5://127.0.0.1:{port}", timeout=0.1)
+        finally:
+            server.close()
+
+    result = asyncio.run(run())
+    assert result["alive"] is False
+    assert result["error"] == "timed out"
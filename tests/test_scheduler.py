@@ -0,0 +1,80 @@
+import asyncio
+import importlib.util
+import pathlib
+import threading
+import time
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def test_scheduler_caps_sessions_and_reports_status():
+    release = threading.Event()
+    statuses = []
+    in_flight = 0
+    peak = 0
+
+    async def runner(profile, launcher):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        in_flight -= 1
+        if profile == "bad.json":
+            raise RuntimeError("launch failed")
+
+    scheduler = antic.LaunchScheduler(max_sessions=2, on_status=lambda p, s: statuses.append((p, s)), runner=runner)
+    futures = [scheduler.submit(f"Profile {n}.json") for n in range(3)] + [scheduler.submit("bad.json")]
+    assert scheduler.submit("Profile 0.json") is None
+    assert len(scheduler.running()) == 4
+
+    for _ in range(500):
+        if list(scheduler.running().values()).count("running") == 2:
+            break
+        time.sleep(0.01)
+    assert list(scheduler.running().values()).count("queued") == 2
+    release.set()
+    for future in futures:
+        try:
+            future.result(timeout=5)
+        except RuntimeError:
+            pass
+    scheduler.stop(timeout=5)
+
+    assert peak == 2
+    assert scheduler.running() == {}
+    assert ("bad.json", "failed") in statuses
+    assert [s for p, s in statuses if p == "Profile 0.json"] == ["queued", "running", "closed"]
+
+
+def test_scheduler_launches_a_profile_once_when_submitted_concurrently():
+    release = threading.Event()
+    launches = []
+
+    async def runner(profile, launcher):
+        launches.append(profile)
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+
+    scheduler = antic.LaunchScheduler(on_status=lambda p, s: scheduler.running(), runner=runner)
+    scheduler.start()
+    barrier = threading.Barrier(8)
+    futures = []
+
+    def click():
+        barrier.wait()
+        futures.append(scheduler.submit("Profile 0.json"))
+
+    threads = [threading.Thread(target=click) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    release.set()
+    accepted = [future for future in futures if future is not None]
+    assert len(accepted) == 1
+    accepted[0].result(timeout=5)
+    scheduler.stop(timeout=5)
+    assert launches == ["Profile 0.json"]
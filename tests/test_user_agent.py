@@ -0,0 +1,109 @@
+import importlib.util
+import json
+import pathlib
+import time
+
+spec = importlib.util.spec_from_file_location("antic", pathlib.Path(__file__).resolve().parents[1] / "antic.py")
+antic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(antic)
+
+
+def use_cache_file(tmp_path, monkeypatch, record=None):
+    cache_file = tmp_path / "user_agent.json"
+    if record is not None:
+        cache_file.write_text(json.dumps(record), encoding="utf-8")
+    monkeypatch.setattr(antic, "USER_AGENT_CACHE_PATH", str(cache_file))
+    monkeypatch.setattr(antic, "_user_agent", None)
+    monkeypatch.setattr(antic, "_user_agent_refresh", None)
+    monkeypatch.setattr(antic, "_user_agent_attempted", 0.0)
+    return cache_file
+
+
+def test_get_user_agent_offline_falls_back_to_snapshot(tmp_path, monkeypatch):
+    use_cache_file(tmp_path, monkeypatch)
+
+    def offline(*args, **kwargs):
+        raise antic.requests.ConnectionError("offline")
+
+    monkeypatch.setattr(antic.requests, "get", offline)
+    assert antic.get_user_agent() == antic.DEFAULT_USER_AGENT
+    antic._user_agent_refresh.join()
+    assert antic.get_user_agent() == antic.DEFAULT_USER_AGENT
+
+
+def test_get_user_agent_fresh_cache_skips_network(tmp_path, monkeypatch):
+    use_cache_file(tmp_path, monkeypatch, {"user_agent": "Cached/1.0", "fetched_at": time.time()})
+    monkeypatch.setattr(antic.requests, "get", None)
+    assert antic.get_user_agent() == "Cached/1.0"
+    assert antic._user_agent_refresh is None
+
+
+def test_get_user_agent_stale_cache_refreshes_in_background(tmp_path, monkeypatch):
+    cache_file = use_cache_file(tmp_path, monkeypatch, {"user_agent": "Stale/1.0", "fetched_at": 0})
+
+    class Response:
+        def json(self):
+            return ["Fresh/2.0"]
+
+    monkeypatch.setattr(antic.requests, "get", lambda *args, **kwargs: Response())
+    first = antic.get_user_agent()
+    antic._user_agent_refresh.join()
+    assert first in ("Stale/1.0", "Fresh/2.0")
+    assert antic.get_user_agent() == "Fresh/2.0"
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["user_agent"] == "Fresh/2.0"
+
+
+def test_get_user_agent_refreshes_the_memo_once_the_ttl_runs_out(tmp_path, monkeypatch):
+    use_cache_file(tmp_path, monkeypatch, {"user_agent": "Cached/1.0", "fetched_at": time.time()})
+
+    class Response:
+        def json(self):
+            return ["Fresh/2.0"]
+
+    monkeypatch.setattr(antic.requests, "get", lambda *args, **kwargs: Response())
+    assert antic.get_user_agent() == "Cached/1.0"
+    assert antic._user_agent_refresh is None
+
+    now = time.time()
+    monkeypatch.setattr(antic.time, "time", lambda: now + antic.USER_AGENT_TTL)
+    antic.get_user_agent()
+    antic._user_agent_refresh.join()
+    assert antic.get_user_agent() == "Fresh/2.0"
+
+
+def test_get_user_agent_retries_a_failed_refresh_without_rereading_the_cache(tmp_path, monkeypatch):
+    use_cache_file(tmp_path, monkeypatch)
+    calls = []
+
+    def offline(*args, **kwargs):
+        calls.append(args)
+        raise antic.requests.ConnectionError("offline")
+
+    loads = []
+    load_user_agent_cache = antic.load_user_agent_cache
+    monkeypatch.setattr(antic, "load_user_agent_cache", lambda: loads.append(1) or load_user_agent_cache())
+    monkeypatch.setattr(antic.requests, "get", offline)
+    assert antic.get_user_agent() == antic.DEFAULT_USER_AGENT
+    antic._user_agent_refresh.join()
+    assert antic.get_user_agent() == antic.DEFAULT_USER_AGENT
+    assert len(calls) == 1
+
+    now = time.time()
+    monkeypatch.setattr(antic.time, "time", lambda: now + antic.USER_AGENT_RETRY_INTERVAL)
+    antic.get_user_agent()
+    antic._user_agent_refresh.join()
+    assert len(calls) == 2
+    assert len(loads) == 1
+
+
+def test_refresh_user_agent_keeps_the_value_when_the_cache_is_not_writable(tmp_path, monkeypatch):
+    use_cache_file(tmp_path, monkeypatch)
+    monkeypatch.setattr(antic, "USER_AGENT_CACHE_PATH", str(tmp_path / "missing" / "user_agent.json"))
+
+    class Response:
+        def json(self):
+            return ["Fresh/2.0"]
+
+    monkeypatch.setattr(antic.requests, "get", lambda *args, **kwargs: Response())
+    assert antic.refresh_user_agent() == "Fresh/2.0"
+    assert antic.get_user_agent() == "Fresh/2.0"